@@ -22,16 +22,15 @@ Then open http://127.0.0.1:8050 in your browser.
 """
 
 import math
-import io
-import base64
+import re
+import tempfile
+from functools import lru_cache
+from types import MappingProxyType
 
 import dash
-from dash import html, dcc, Input, Output, State, dash_table, callback
+from dash import html, dcc, Input, Output, State, MATCH, dash_table, callback, no_update
 
-import matplotlib
-matplotlib.use("Agg")  # non-interactive backend — must be set before importing pyplot
-import matplotlib.pyplot as plt
-from matplotlib.ticker import AutoMinorLocator
+import numpy as np
 import os
 # ═══════════════════════════════════════════════════════════════════════════════
 # THERMODYNAMIC CONSTANTS
@@ -46,11 +45,79 @@ CP_WATER = 4.186     # kJ/(kg·K) — specific heat of water
 BIOGAS_LHV = 22.0    # MJ/m³ — lower heating value of biogas
 HYDROCHAR_HHV = 25.0 # MJ/kg — higher heating value of hydrochar
 
+_GAMMA_EXP = (GAMMA_AIR - 1) / GAMMA_AIR  # isentropic T–p exponent for air
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # THERMODYNAMIC CALCULATIONS
 # ═══════════════════════════════════════════════════════════════════════════════
+# These are pure functions of their (hashable) slider inputs, so results are
+# memoized.  Callers share the cached dicts and must treat them as read-only.
+
+
+def _state_array(values):
+    """Pack state-point values into a read-only float ndarray."""
+    arr = np.array(values, dtype=float)
+    arr.flags.writeable = False
+    return arr
+
+
+_LOG_FLOOR = 1e-300  # keeps log() arguments inside its domain
+
 
+def _safe_log(x):
+    """math.log clamped so non-physical inputs cannot raise a domain error."""
+    return math.log(max(x, _LOG_FLOOR))
+
+
+def _safe_log_vec(x):
+    """Elementwise counterpart of _safe_log for ndarrays."""
+    return np.log(np.maximum(x, _LOG_FLOOR))
+
+
+def _brayton_core(T1, rp, T3, eta_c, eta_t, log=_safe_log):
+    """
+    Numeric kernel of the Brayton cycle (temperatures in K).
+
+    Returns the tuple
+        (T2, T4, w_comp, w_turb, w_net, q_in, q_out, s2, s3, s4, h2, h3, h4)
+    with state 1 as the zero reference for entropy and enthalpy.  Pass
+    log=_safe_log_vec to evaluate it elementwise on broadcastable ndarrays.
+    """
+    # Isentropic temperature ratio, shared by compression and expansion
+    tau = rp ** _GAMMA_EXP
+
+    # Isentropic compression
+    T2s = T1 * tau
+    T2 = T1 + (T2s - T1) / eta_c
+
+    # Isentropic expansion
+    T4s = T3 / tau
+    T4 = T3 - (T3 - T4s) * eta_t
+
+    # Work & heat (per kg of air)
+    w_comp = CP_AIR * (T2 - T1)
+    w_turb = CP_AIR * (T3 - T4)
+    w_net = w_turb - w_comp
+    q_in = CP_AIR * (T3 - T2)
+    q_out = CP_AIR * (T4 - T1)
+
+    # Entropy
+    r_log_rp = R_AIR * log(rp)
+    s2 = CP_AIR * log(T2 / T1) - r_log_rp
+    s3 = s2 + CP_AIR * log(T3 / T2)
+    s4 = s3 + CP_AIR * log(T4 / T3) + r_log_rp
+
+    # Enthalpy
+    h2 = CP_AIR * (T2 - T1)
+    h3 = CP_AIR * (T3 - T1)
+    h4 = CP_AIR * (T4 - T1)
+
+    return (T2, T4, w_comp, w_turb, w_net, q_in, q_out,
+            s2, s3, s4, h2, h3, h4)
+
+
+@lru_cache(maxsize=512)
 def brayton_cycle(T1_C, rp, T3_C, eta_c, eta_t):
     """
     Calculate Brayton (gas turbine) cycle state points and performance.
@@ -69,39 +136,20 @@ def brayton_cycle(T1_C, rp, T3_C, eta_c, eta_t):
     T1 = T1_C + 273.15
     T3 = T3_C + 273.15
 
-    # Isentropic compression
-    T2s = T1 * rp ** ((GAMMA_AIR - 1) / GAMMA_AIR)
-    T2 = T1 + (T2s - T1) / eta_c
-
-    # Isentropic expansion
-    T4s = T3 / rp ** ((GAMMA_AIR - 1) / GAMMA_AIR)
-    T4 = T3 - (T3 - T4s) * eta_t
+    (T2, T4, w_comp, w_turb, w_net, q_in, q_out,
+     s2, s3, s4, h2, h3, h4) = _brayton_core(T1, rp, T3, eta_c, eta_t)
 
-    # Work & heat (per kg of air)
-    w_comp = CP_AIR * (T2 - T1)
-    w_turb = CP_AIR * (T3 - T4)
-    w_net = w_turb - w_comp
-    q_in = CP_AIR * (T3 - T2)
-    q_out = CP_AIR * (T4 - T1)
     eta_th = (w_net / q_in * 100) if q_in > 0 else 0
     bwr = (w_comp / w_turb * 100) if w_turb > 0 else 0
 
-    # Entropy (relative to state 1 = 0)
+    # State 1 is the reference for entropy and enthalpy
     s1 = 0.0
-    s2 = CP_AIR * math.log(T2 / T1) - R_AIR * math.log(rp)
-    s3 = s2 + CP_AIR * math.log(T3 / T2)
-    s4 = s3 + CP_AIR * math.log(T4 / T3) + R_AIR * math.log(rp)
-
-    # Enthalpy (relative to state 1 = 0)
     h1 = 0.0
-    h2 = CP_AIR * (T2 - T1)
-    h3 = CP_AIR * (T3 - T1)
-    h4 = CP_AIR * (T4 - T1)
 
     states = dict(
-        T=[T1 - 273.15, T2 - 273.15, T3 - 273.15, T4 - 273.15],
-        h=[h1, h2, h3, h4],
-        s=[s1, s2, s3, s4],
+        T=_state_array([T1 - 273.15, T2 - 273.15, T3 - 273.15, T4 - 273.15]),
+        h=_state_array([h1, h2, h3, h4]),
+        s=_state_array([s1, s2, s3, s4]),
         labels=["1 – Comp Inlet", "2 – Comp Outlet",
                 "3 – Turb Inlet", "4 – Turb Outlet"],
     )
@@ -119,6 +167,52 @@ def brayton_cycle(T1_C, rp, T3_C, eta_c, eta_t):
     return states, metrics
 
 
+def brayton_cycle_vec(T1_C, rp, T3_C, eta_c, eta_t):
+    """
+    Vectorized Brayton cycle for parametric sweeps.
+
+    Takes the same parameters as brayton_cycle, but any of them may be an
+    ndarray; inputs are broadcast against each other.  State arrays have a
+    leading axis of length 4 (one row per state point) followed by the
+    broadcast shape, and every metric is an unrounded ndarray of the broadcast
+    shape.
+    """
+    T1_C, rp, T3_C, eta_c, eta_t = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (T1_C, rp, T3_C, eta_c, eta_t)))
+    T1 = T1_C + 273.15
+    T3 = T3_C + 273.15
+
+    (T2, T4, w_comp, w_turb, w_net, q_in, q_out,
+     s2, s3, s4, h2, h3, h4) = _brayton_core(T1, rp, T3, eta_c, eta_t,
+                                             log=_safe_log_vec)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta_th = np.where(q_in > 0, w_net / q_in * 100, 0.0)
+        bwr = np.where(w_turb > 0, w_comp / w_turb * 100, 0.0)
+
+    zero = np.zeros_like(T1)
+    states = dict(
+        T=np.stack([T1, T2, T3, T4]) - 273.15,
+        h=np.stack([zero, h2, h3, h4]),
+        s=np.stack([zero, s2, s3, s4]),
+        labels=["1 – Comp Inlet", "2 – Comp Outlet",
+                "3 – Turb Inlet", "4 – Turb Outlet"],
+    )
+
+    metrics = dict(
+        w_comp=w_comp,
+        w_turb=w_turb,
+        w_net=w_net,
+        q_in=q_in,
+        q_out=q_out,
+        eta_th=eta_th,
+        bwr=bwr,
+    )
+
+    return states, metrics
+
+
+@lru_cache(maxsize=512)
 def htc_steam_cycle(T_reactor=200, P_reactor=20):
     """
     Simplified HTC steam (Rankine-like) cycle analysis.
@@ -153,9 +247,9 @@ def htc_steam_cycle(T_reactor=200, P_reactor=20):
     s4 = s3 + 0.15  # entropy increase due to irreversibilities
 
     states = dict(
-        T=[T1, T1 + 2, T3, T1 + 20],
-        h=[round(h1, 1), round(h2, 1), round(h3, 1), round(h4, 1)],
-        s=[round(s1, 4), round(s2, 4), round(s3, 4), round(s4, 4)],
+        T=_state_array([T1, T1 + 2, T3, T1 + 20]),
+        h=_state_array([round(h1, 1), round(h2, 1), round(h3, 1), round(h4, 1)]),
+        s=_state_array([round(s1, 4), round(s2, 4), round(s3, 4), round(s4, 4)]),
         labels=["1 – Pump Inlet", "2 – Pump Outlet",
                 "3 – Boiler Outlet", "4 – Turb Outlet"],
     )
@@ -177,9 +271,11 @@ def htc_steam_cycle(T_reactor=200, P_reactor=20):
     return states, metrics
 
 
-def ad_biogas_yield(feed_rate, moisture_pct, vs_fraction=0.80):
+def ad_biogas_yield_vec(feed_rate, moisture_pct, vs_fraction=0.80):
     """
     Estimate biogas yield from anaerobic digestion of moisture-rich biomass.
+
+    Any parameter may be an ndarray; values are returned unrounded.
     """
     dry_mass = feed_rate * (1 - moisture_pct / 100)
     volatile_solids = dry_mass * vs_fraction
@@ -188,17 +284,28 @@ def ad_biogas_yield(feed_rate, moisture_pct, vs_fraction=0.80):
     biogas_energy = biogas_m3_h * BIOGAS_LHV   # MJ/h
 
     return dict(
-        dry_mass=round(dry_mass, 2),
-        volatile_solids=round(volatile_solids, 2),
-        biogas_m3_h=round(biogas_m3_h, 2),
-        methane_m3_h=round(methane_m3_h, 2),
-        biogas_energy_MJ_h=round(biogas_energy, 2),
+        dry_mass=dry_mass,
+        volatile_solids=volatile_solids,
+        biogas_m3_h=biogas_m3_h,
+        methane_m3_h=methane_m3_h,
+        biogas_energy_MJ_h=biogas_energy,
     )
 
 
-def htc_process(feed_rate, moisture_pct, T_reactor=200):
+@lru_cache(maxsize=512)
+def ad_biogas_yield(feed_rate, moisture_pct, vs_fraction=0.80):
+    """
+    Estimate biogas yield from anaerobic digestion of moisture-rich biomass.
+    """
+    res = ad_biogas_yield_vec(feed_rate, moisture_pct, vs_fraction)
+    return {k: round(v, 2) for k, v in res.items()}
+
+
+def htc_process_vec(feed_rate, moisture_pct, T_reactor=200):
     """
     Estimate HTC (Hydrothermal Carbonization) products from moisture-lean biomass.
+
+    Any parameter may be an ndarray; values are returned unrounded.
     """
     dry_mass = feed_rate * (1 - moisture_pct / 100)
     hydrochar_yield = dry_mass * 0.60
@@ -207,14 +314,23 @@ def htc_process(feed_rate, moisture_pct, T_reactor=200):
     energy_required = feed_rate * CP_WATER * (T_reactor - 25) / 1000  # MJ/h
 
     return dict(
-        dry_mass=round(dry_mass, 2),
-        hydrochar_kg_h=round(hydrochar_yield, 2),
-        process_water_kg_h=round(process_water, 2),
-        hydrochar_energy_MJ_h=round(hydrochar_energy, 2),
-        energy_required_MJ_h=round(energy_required, 2),
+        dry_mass=dry_mass,
+        hydrochar_kg_h=hydrochar_yield,
+        process_water_kg_h=process_water,
+        hydrochar_energy_MJ_h=hydrochar_energy,
+        energy_required_MJ_h=energy_required,
     )
 
 
+@lru_cache(maxsize=512)
+def htc_process(feed_rate, moisture_pct, T_reactor=200):
+    """
+    Estimate HTC (Hydrothermal Carbonization) products from moisture-lean biomass.
+    """
+    res = htc_process_vec(feed_rate, moisture_pct, T_reactor)
+    return {k: round(v, 2) for k, v in res.items()}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANIMATED SVG SCHEMATIC (inline HTML)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -588,8 +704,65 @@ def build_schematic_html():
 </html>"""
 
 
+def _minify_html(doc):
+    """
+    Strip HTML/CSS comments and collapse whitespace.  Safe for the schematic:
+    its <text> labels contain no whitespace runs and SVG collapses them anyway.
+    """
+    doc = re.sub(r"<!--.*?-->", "", doc, flags=re.S)
+    doc = re.sub(r"/\*.*?\*/", "", doc, flags=re.S)
+    doc = re.sub(r"\s+", " ", doc)
+    return re.sub(r">\s+<", "><", doc).strip()
+
+
+# Built once at import — the schematic never changes between page loads.
+_SCHEMATIC_HTML = _minify_html(build_schematic_html())
+
+_SCHEMATIC_ASSET = "schematic.html"
+
+
+def _write_schematic_asset():
+    """
+    Publish the schematic under assets/ so Dash serves it as a static file
+    the browser can cache, instead of inlining it in every layout.
+
+    The file is only rewritten when its content changed, so the dev-server
+    asset watcher does not reload on every start.  Writes go to a temp file
+    that is atomically renamed into place, so concurrent workers and the
+    static route never see a partial file.  Returns False when the asset
+    cannot be written (e.g. a read-only code directory).
+    """
+    assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "assets")
+    path = os.path.join(assets_dir, _SCHEMATIC_ASSET)
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == _SCHEMATIC_HTML:
+                return True
+    except OSError:
+        pass
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=assets_dir, prefix=".schematic-",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_SCHEMATIC_HTML)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+# When the asset can't be published, the Iframe falls back to srcDoc.
+_SCHEMATIC_SERVED = _write_schematic_asset()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
-# CHART BUILDERS  (matplotlib → base64 PNG)
+# CHART BUILDERS  (Plotly figure dicts, rendered client-side by dcc.Graph)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 # Dark-theme colours shared by every chart
@@ -605,109 +778,107 @@ _ORANGE   = "#ff8833"
 _TEXT     = "#e0e0f0"
 
 
-def _fig_to_base64(fig):
-    """Render a matplotlib Figure to a data-URI string for html.Img src."""
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight",
-                facecolor=fig.get_facecolor(), edgecolor="none")
-    plt.close(fig)
-    buf.seek(0)
-    b64 = base64.b64encode(buf.read()).decode("utf-8")
-    return f"data:image/png;base64,{b64}"
+def _close_cycle(arr):
+    """Append the first state point so the plotted path closes."""
+    return np.concatenate([arr, arr[:1]])
 
 
-def _style_ax(ax, xlabel, ylabel):
-    """Apply the dark theme to an Axes object."""
-    ax.set_facecolor(_FACE)
-    ax.set_xlabel(xlabel, color=_LABEL, fontsize=11, fontfamily="sans-serif")
-    ax.set_ylabel(ylabel, color=_LABEL, fontsize=11, fontfamily="sans-serif")
-    ax.tick_params(colors=_TICK, labelsize=9)
-    ax.xaxis.set_minor_locator(AutoMinorLocator())
-    ax.yaxis.set_minor_locator(AutoMinorLocator())
-    ax.grid(True, which="major", color=_GRID, linewidth=0.6)
-    ax.grid(True, which="minor", color=_GRID, linewidth=0.25, alpha=0.5)
-    for spine in ax.spines.values():
-        spine.set_color(_SPINE)
+def _axis(label):
+    """Dark-theme axis settings."""
+    return dict(
+        title=dict(text=label, font=dict(color=_LABEL, size=13)),
+        tickfont=dict(color=_TICK, size=11),
+        gridcolor=_GRID, gridwidth=0.6,
+        minor=dict(showgrid=True, gridcolor=_GRID, gridwidth=0.25),
+        linecolor=_SPINE, mirror=True, zeroline=False,
+    )
 
 
-def make_hs_chart(states):
-    """Create an h-s (enthalpy–entropy) diagram for the HTC steam cycle (matplotlib)."""
-    s = states["s"] + [states["s"][0]]
-    h = states["h"] + [states["h"][0]]
-    labels = states["labels"] + [states["labels"][0]]
+def _chart_layout(title, xlabel, ylabel, title_color=_TITLE):
+    """Dark-theme figure layout."""
+    return dict(
+        title=dict(text=title, x=0.5, font=dict(color=title_color, size=15)),
+        paper_bgcolor=_BG,
+        plot_bgcolor=_FACE,
+        font=dict(family="Inter, sans-serif", color=_LABEL),
+        margin=dict(l=64, r=24, t=56, b=56),
+        showlegend=False,
+        xaxis=_axis(xlabel),
+        yaxis=_axis(ylabel),
+    )
 
-    fig, ax = plt.subplots(figsize=(6.5, 4.5))
-    fig.patch.set_facecolor(_BG)
 
-    # Cycle path
-    ax.plot(s, h, color=_CYAN, linewidth=2.4, zorder=2)
-    ax.scatter(s, h, s=80, color=_CYAN, edgecolors="#ffffff",
-               linewidths=1.5, zorder=3)
+def _cycle_trace(x, y, labels, color):
+    """Closed cycle path with state-point markers and short labels."""
+    return dict(
+        type="scatter",
+        x=x, y=y,
+        mode="lines+markers+text",
+        line=dict(color=color, width=2.4),
+        marker=dict(size=10, color=color, line=dict(color="#ffffff", width=1.5)),
+        text=[lbl.split("–")[0].strip() for lbl in labels],
+        textposition="top center",
+        textfont=dict(color=_TEXT, size=12, family="monospace"),
+        hovertext=labels,
+        hoverinfo="text+x+y",
+    )
+
+
+# Chart layouts depend only on the chart type, so both figures share one
+# prebuilt layout each instead of rebuilding it on every analysis.
+_HS_LAYOUT = _chart_layout("h – s Diagram  ·  HTC Steam Cycle",
+                           "Entropy  s  [kJ/(kg·K)]", "Enthalpy  h  [kJ/kg]")
+_TH_LAYOUT = _chart_layout("T – Ḣ Diagram  ·  Gas Turbine Cycle",
+                           "Enthalpy Rate  Ḣ  [kW]", "Temperature  T  [°C]")
+
 
-    # State-point labels
-    for xi, yi, lbl in zip(s, h, labels):
-        short = lbl.split("–")[0].strip()
-        ax.annotate(short, (xi, yi), textcoords="offset points",
-                    xytext=(0, 12), ha="center", fontsize=10,
-                    color=_TEXT, fontfamily="monospace", fontweight="bold")
+def make_hs_chart(states):
+    """Create an h-s (enthalpy–entropy) diagram for the HTC steam cycle."""
+    s = _close_cycle(states["s"])
+    h = _close_cycle(states["h"])
+    labels = states["labels"] + [states["labels"][0]]
 
-    ax.set_title("h – s Diagram  ·  HTC Steam Cycle",
-                 color=_TITLE, fontsize=13, pad=12)
-    _style_ax(ax, "Entropy  s  [kJ/(kg·K)]", "Enthalpy  h  [kJ/kg]")
-    fig.tight_layout()
-    return _fig_to_base64(fig)
+    return dict(
+        data=[_cycle_trace(s, h, labels, _CYAN)],
+        layout=_HS_LAYOUT,
+    )
 
 
 def make_t_hdot_chart(states, m_air=1.0):
     """
     Create a T-Ḣ (temperature vs enthalpy-rate) diagram for the gas turbine
-    cycle (matplotlib).  Ḣ = ṁ · h  (kW when ṁ in kg/s).
+    cycle.  Ḣ = ṁ · h  (kW when ṁ in kg/s).
     """
-    T = states["T"]
-    h = states["h"]
-    H_dot = [hi * m_air for hi in h]
+    H_dot = states["h"] * m_air
     labels = states["labels"]
 
     # Close the cycle
-    T_c = T + [T[0]]
-    H_c = H_dot + [H_dot[0]]
+    T_c = _close_cycle(states["T"])
+    H_c = _close_cycle(H_dot)
     labels_c = labels + [labels[0]]
 
-    fig, ax = plt.subplots(figsize=(6.5, 4.5))
-    fig.patch.set_facecolor(_BG)
-
-    ax.plot(H_c, T_c, color=_ORANGE, linewidth=2.4, zorder=2)
-    ax.scatter(H_c, T_c, s=80, color=_ORANGE, edgecolors="#ffffff",
-               linewidths=1.5, zorder=3)
+    return dict(
+        data=[_cycle_trace(H_c, T_c, labels_c, _ORANGE)],
+        layout=_TH_LAYOUT,
+    )
 
-    for xi, yi, lbl in zip(H_c, T_c, labels_c):
-        short = lbl.split("–")[0].strip()
-        ax.annotate(short, (xi, yi), textcoords="offset points",
-                    xytext=(0, 12), ha="center", fontsize=10,
-                    color=_TEXT, fontfamily="monospace", fontweight="bold")
 
-    ax.set_title("T – Ḣ Diagram  ·  Gas Turbine Cycle",
-                 color=_TITLE, fontsize=13, pad=12)
-    _style_ax(ax, "Enthalpy Rate  Ḣ  [kW]", "Temperature  T  [°C]")
-    fig.tight_layout()
-    return _fig_to_base64(fig)
+def empty_chart(title=""):
+    """Return a placeholder figure shown before the first analysis."""
+    layout = _chart_layout(title, "", "", title_color="#555577")
+    layout["xaxis"] = layout["yaxis"] = dict(visible=False)
+    layout["annotations"] = [dict(
+        text="Click  ANALYZE  to generate chart",
+        x=0.5, y=0.5, xref="paper", yref="paper",
+        showarrow=False, font=dict(size=16, color="#555577"),
+    )]
+    return dict(data=[], layout=layout)
 
 
-def empty_chart(title=""):
-    """Return a placeholder matplotlib chart as a base64 data-URI."""
-    fig, ax = plt.subplots(figsize=(6.5, 4.5))
-    fig.patch.set_facecolor(_BG)
-    ax.set_facecolor(_BG)
-    ax.text(0.5, 0.5, "Click  ANALYZE  to generate chart",
-            transform=ax.transAxes, ha="center", va="center",
-            fontsize=14, color="#555577")
-    ax.set_title(title, color="#555577", fontsize=13, pad=12)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    fig.tight_layout()
-    return _fig_to_base64(fig)
+# The placeholders never change: build them once so each layout request
+# serializes the same plain dicts.
+_EMPTY_HS = empty_chart("h – s Diagram")
+_EMPTY_TH = empty_chart("T – Ḣ Diagram")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -725,17 +896,29 @@ app = dash.Dash(
 server = app.server  # for production deployment
 
 
+# ── Pattern-matching ids for slider rows ──
+def _slider_id(slider_id):
+    return {"type": "slider", "id": slider_id}
+
+
+def _display_id(slider_id):
+    return {"type": "slider-display", "id": slider_id}
+
+
 # ── Helper to build a parameter slider row ──
 def param_row(label, slider_id, min_val, max_val, step, value, unit, marks=None):
     return html.Div(className="param-group", children=[
         html.Div(label, className="param-label"),
-        html.Div(f"{value} {unit}", id=f"{slider_id}-display",
+        html.Div(f"{value} {unit}", id=_display_id(slider_id),
                  className="param-value-display"),
         dcc.Slider(
-            id=slider_id,
+            id=_slider_id(slider_id),
             min=min_val, max=max_val, step=step, value=value,
             marks=marks or {},
             tooltip={"placement": "bottom", "always_visible": False},
+            # Fire callbacks once on release, not on every tick of a drag;
+            # the tooltip still tracks the value live.
+            updatemode="mouseup",
         ),
     ])
 
@@ -769,8 +952,9 @@ app.layout = html.Div([
         ]),
         html.Div(className="glass-card pulse-glow", children=[
             html.Iframe(
-                srcDoc=build_schematic_html(),
                 className="schematic-frame",
+                **({"src": app.get_asset_url(_SCHEMATIC_ASSET)}
+                   if _SCHEMATIC_SERVED else {"srcDoc": _SCHEMATIC_HTML}),
             ),
         ]),
 
@@ -831,13 +1015,15 @@ app.layout = html.Div([
             ]),
         ]),
         html.Div(className="charts-grid", children=[
-            html.Div(className="glass-card mpl-chart-wrap", children=[
-                html.Img(id="chart-hs-img", className="mpl-chart",
-                         src=empty_chart("h – s Diagram")),
+            html.Div(className="glass-card chart-wrap", children=[
+                dcc.Graph(id="chart-hs", className="chart-graph",
+                          figure=_EMPTY_HS,
+                          config={"displaylogo": False}),
             ]),
-            html.Div(className="glass-card mpl-chart-wrap", children=[
-                html.Img(id="chart-th-img", className="mpl-chart",
-                         src=empty_chart("T – Ḣ Diagram")),
+            html.Div(className="glass-card chart-wrap", children=[
+                dcc.Graph(id="chart-th", className="chart-graph",
+                          figure=_EMPTY_TH,
+                          config={"displaylogo": False}),
             ]),
         ]),
 
@@ -855,6 +1041,9 @@ app.layout = html.Div([
                      style={"textAlign": "center", "padding": "40px",
                             "color": "#555577", "fontSize": "15px"}),
         ]),
+
+        # Parameters of the analysis currently on screen (per browser tab)
+        dcc.Store(id="analysis-key"),
     ]),
 
     # ── Footer ──
@@ -870,44 +1059,82 @@ app.layout = html.Div([
 # CALLBACKS — LIVE SLIDER DISPLAY UPDATES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-_slider_units = {
+# Read-only lookup shared by every invocation of the MATCH callback below.
+_slider_units = MappingProxyType({
     "ta-feed": "kg/h", "ta-moist": "%", "ta-treact": "°C",
     "tb-feed": "kg/h", "tb-moist": "%", "tb-vs": "",
     "gt-rp": "", "gt-tit": "°C", "gt-tamb": "°C",
     "gt-etac": "%", "gt-etat": "%",
+})
+
+@callback(
+    Output(_display_id(MATCH), "children"),
+    Input(_slider_id(MATCH), "value"),
+    State(_slider_id(MATCH), "id"),
+    prevent_initial_call=False,
+)
+def _update_display(val, slider_id):
+    return f"{val} {_slider_units[slider_id['id']]}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# REPORT TABLE STYLES
+# ═══════════════════════════════════════════════════════════════════════════════
+# Shared by every report DataTable and never mutated.  Kept as plain dicts:
+# Dash's JSON encoder cannot serialize read-only mapping proxies.
+
+_HEADER_STYLE = {
+    "color": "#ccc",
+    "fontWeight": "600",
+    "border": "1px solid rgba(100,120,255,0.1)",
+    "fontFamily": "Inter, sans-serif",
+    "fontSize": "12px",
+}
+_HEADER_STYLE_CYAN = {**_HEADER_STYLE, "backgroundColor": "rgba(0,212,255,0.08)"}
+_HEADER_STYLE_GREEN = {**_HEADER_STYLE, "backgroundColor": "rgba(0,232,143,0.08)"}
+
+_CELL_STYLE = {
+    "backgroundColor": "rgba(10,10,30,0.5)",
+    "color": "#bbb",
+    "border": "1px solid rgba(100,120,255,0.06)",
+    "fontFamily": "JetBrains Mono, monospace",
+    "fontSize": "13px",
+    "padding": "10px 14px",
 }
+_CELL_STYLE_LEFT = {**_CELL_STYLE, "textAlign": "left"}
+_CELL_STYLE_CENTER = {**_CELL_STYLE, "textAlign": "center"}
 
-for _sid, _unit in _slider_units.items():
-    @callback(
-        Output(f"{_sid}-display", "children"),
-        Input(_sid, "value"),
-        prevent_initial_call=False,
-    )
-    def _update_display(val, unit=_unit):
-        return f"{val} {unit}"
+_ODD_ROW_STYLE = [
+    {"if": {"row_index": "odd"},
+     "backgroundColor": "rgba(20,20,50,0.5)"},
+]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CALLBACK — ANALYZE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@callback(
-    Output("chart-hs-img", "src"),
-    Output("chart-th-img", "src"),
-    Output("report-area", "children"),
-    Input("btn-analyze", "n_clicks"),
-    State("ta-feed", "value"),  State("ta-moist", "value"),
-    State("ta-treact", "value"),
-    State("tb-feed", "value"),  State("tb-moist", "value"),
-    State("tb-vs", "value"),
-    State("gt-rp", "value"),    State("gt-tit", "value"),
-    State("gt-tamb", "value"),  State("gt-etac", "value"),
-    State("gt-etat", "value"),
-    prevent_initial_call=True,
-)
-def run_analysis(n, ta_feed, ta_moist, ta_treact,
-                 tb_feed, tb_moist, tb_vs,
-                 gt_rp, gt_tit, gt_tamb, gt_etac, gt_etat):
+# Slider steps in run_analysis argument order, used to quantize cache keys.
+_PARAM_STEPS = (50, 1, 5, 50, 1, 0.05, 1, 25, 1, 1, 1)
+
+
+def _quantize(value, step):
+    """Snap a slider value to its step so float noise cannot miss the cache."""
+    return round(round(value / step) * step, 6)
+
+
+@lru_cache(maxsize=128)
+def _compute(params):
+    """
+    Run the full analysis for one quantized parameter tuple.
+
+    Returns (fig_hs, fig_th, results) where results holds the raw numbers
+    the report is built from.  Dash components are not cached: the report
+    is rebuilt from these numbers on every call.
+    """
+    (ta_feed, ta_moist, ta_treact,
+     tb_feed, tb_moist, tb_vs,
+     gt_rp, gt_tit, gt_tamb, gt_etac, gt_etat) = params
 
     # ── Run calculations ──
     gt_states, gt_metrics = brayton_cycle(
@@ -922,12 +1149,11 @@ def run_analysis(n, ta_feed, ta_moist, ta_treact,
     # Estimate air mass flow from biogas energy
     m_air = ad_results["biogas_energy_MJ_h"] / (gt_metrics["q_in"] / 1000) \
         if gt_metrics["q_in"] > 0 else 1.0
-    m_air = round(m_air, 2)
 
-    # Net power output
-    gt_power_kW = round(gt_metrics["w_net"] * m_air / 3.6, 2)
-    htc_power_kW = round(htc_metrics["w_net"] * ta_feed / 3600, 2)
-    total_power = round(gt_power_kW + htc_power_kW, 2)
+    # Net power output (kept unrounded; formatted for display in the report)
+    gt_power_kW = gt_metrics["w_net"] * m_air / 3.6
+    htc_power_kW = htc_metrics["w_net"] * ta_feed / 3600
+    total_power = gt_power_kW + htc_power_kW
 
     # -----------------------------
     # OVERALL PLANT EFFICIENCY
@@ -957,16 +1183,72 @@ def run_analysis(n, ta_feed, ta_moist, ta_treact,
     fig_hs = make_hs_chart(htc_states)
     fig_th = make_t_hdot_chart(gt_states, m_air)
 
+    results = dict(
+        gt_states=gt_states, gt_metrics=gt_metrics,
+        htc_states=htc_states, htc_metrics=htc_metrics,
+        ad_results=ad_results, htc_results=htc_results,
+        m_air=m_air, total_power=total_power,
+        overall_efficiency=overall_efficiency,
+    )
+
+    return fig_hs, fig_th, results
+
+
+@callback(
+    Output("chart-hs", "figure"),
+    Output("chart-th", "figure"),
+    Output("report-area", "children"),
+    Output("analysis-key", "data"),
+    Input("btn-analyze", "n_clicks"),
+    State(_slider_id("ta-feed"), "value"),
+    State(_slider_id("ta-moist"), "value"),
+    State(_slider_id("ta-treact"), "value"),
+    State(_slider_id("tb-feed"), "value"),
+    State(_slider_id("tb-moist"), "value"),
+    State(_slider_id("tb-vs"), "value"),
+    State(_slider_id("gt-rp"), "value"),
+    State(_slider_id("gt-tit"), "value"),
+    State(_slider_id("gt-tamb"), "value"),
+    State(_slider_id("gt-etac"), "value"),
+    State(_slider_id("gt-etat"), "value"),
+    State("analysis-key", "data"),
+    prevent_initial_call=True,
+)
+def run_analysis(n, ta_feed, ta_moist, ta_treact,
+                 tb_feed, tb_moist, tb_vs,
+                 gt_rp, gt_tit, gt_tamb, gt_etac, gt_etat, last_key):
+
+    params = tuple(_quantize(v, step) for v, step in zip(
+        (ta_feed, ta_moist, ta_treact, tb_feed, tb_moist, tb_vs,
+         gt_rp, gt_tit, gt_tamb, gt_etac, gt_etat), _PARAM_STEPS))
+
+    # Same parameters as the analysis already displayed: leave the page as is.
+    # The key round-trips through the browser as a JSON list.
+    if last_key == list(params):
+        return no_update, no_update, no_update, no_update
+
+    fig_hs, fig_th, results = _compute(params)
+
+    gt_states = results["gt_states"]
+    gt_metrics = results["gt_metrics"]
+    htc_states = results["htc_states"]
+    htc_metrics = results["htc_metrics"]
+    ad_results = results["ad_results"]
+    htc_results = results["htc_results"]
+    m_air = results["m_air"]
+    total_power = results["total_power"]
+    overall_efficiency = results["overall_efficiency"]
+
     # ── Build report ──
     # Summary metric cards
     metric_cards = html.Div(className="report-grid", children=[
-        _metric_card("Net Power", f"{total_power}", "kW"),
+        _metric_card("Net Power", f"{total_power:.2f}", "kW"),
         _metric_card("GT Efficiency", f"{gt_metrics['eta_th']}", "%"),
         _metric_card("HTC Efficiency", f"{htc_metrics['eta']}", "%"),
         _metric_card("Biogas Yield", f"{ad_results['biogas_m3_h']}", "m³/h"),
         _metric_card("GT Net Work", f"{gt_metrics['w_net']}", "kJ/kg"),
         _metric_card("Hydrochar", f"{htc_results['hydrochar_kg_h']}", "kg/h"),
-        _metric_card("Air Mass Flow", f"{m_air}", "kg/h"),
+        _metric_card("Air Mass Flow", f"{m_air:.2f}", "kg/h"),
         _metric_card("Back Work Ratio", f"{gt_metrics['bwr']}", "%"),
     ])
 
@@ -1009,22 +1291,9 @@ def run_analysis(n, ta_feed, ta_moist, ta_treact,
             columns=[{"name": "Component", "id": "Component"},
                      {"name": "Value", "id": "Value"}],
             data=energy_data,
-            style_header={
-                "backgroundColor": "rgba(0,212,255,0.08)",
-                "color": "#ccc", "fontWeight": "600",
-                "border": "1px solid rgba(100,120,255,0.1)",
-                "fontFamily": "Inter, sans-serif", "fontSize": "12px",
-            },
-            style_cell={
-                "backgroundColor": "rgba(10,10,30,0.5)",
-                "color": "#bbb", "border": "1px solid rgba(100,120,255,0.06)",
-                "fontFamily": "JetBrains Mono, monospace", "fontSize": "13px",
-                "padding": "10px 14px", "textAlign": "left",
-            },
-            style_data_conditional=[{
-                "if": {"row_index": "odd"},
-                "backgroundColor": "rgba(20,20,50,0.5)",
-            }],
+            style_header=_HEADER_STYLE_CYAN,
+            style_cell=_CELL_STYLE_LEFT,
+            style_data_conditional=_ODD_ROW_STYLE,
         ),
     ])
 
@@ -1046,22 +1315,9 @@ def run_analysis(n, ta_feed, ta_moist, ta_treact,
             columns=[{"name": "Parameter", "id": "Parameter"},
                      {"name": "Value", "id": "Value"}],
             data=process_data,
-            style_header={
-                "backgroundColor": "rgba(0,232,143,0.08)",
-                "color": "#ccc", "fontWeight": "600",
-                "border": "1px solid rgba(100,120,255,0.1)",
-                "fontFamily": "Inter, sans-serif", "fontSize": "12px",
-            },
-            style_cell={
-                "backgroundColor": "rgba(10,10,30,0.5)",
-                "color": "#bbb", "border": "1px solid rgba(100,120,255,0.06)",
-                "fontFamily": "JetBrains Mono, monospace", "fontSize": "13px",
-                "padding": "10px 14px", "textAlign": "left",
-            },
-            style_data_conditional=[{
-                "if": {"row_index": "odd"},
-                "backgroundColor": "rgba(20,20,50,0.5)",
-            }],
+            style_header=_HEADER_STYLE_GREEN,
+            style_cell=_CELL_STYLE_LEFT,
+            style_data_conditional=_ODD_ROW_STYLE,
         ),
     ])
 
@@ -1072,7 +1328,7 @@ def run_analysis(n, ta_feed, ta_moist, ta_treact,
         html.Div(className="report-tables", children=[energy_table, process_table]),
     ])
 
-    return fig_hs, fig_th, report
+    return fig_hs, fig_th, report, list(params)
 
 
 # ── Report helper functions ──
@@ -1086,14 +1342,14 @@ def _metric_card(label, value, unit=""):
 
 
 def _state_table(title, states, table_id):
-    data = []
-    for i in range(len(states["labels"])):
-        data.append({
-            "State": states["labels"][i],
-            "T (°C)": f"{states['T'][i]:.1f}",
-            "h (kJ/kg)": f"{states['h'][i]:.1f}",
-            "s (kJ/kg·K)": f"{states['s'][i]:.4f}",
-        })
+    # Format each column in one vectorized pass over the state arrays
+    T_str = np.char.mod("%.1f", states["T"]).tolist()
+    h_str = np.char.mod("%.1f", states["h"]).tolist()
+    s_str = np.char.mod("%.4f", states["s"]).tolist()
+    data = [
+        {"State": lbl, "T (°C)": T, "h (kJ/kg)": h, "s (kJ/kg·K)": s}
+        for lbl, T, h, s in zip(states["labels"], T_str, h_str, s_str)
+    ]
 
     return html.Div([
         html.Div(title, className="report-table-title"),
@@ -1106,27 +1362,9 @@ def _state_table(title, states, table_id):
                 {"name": "s (kJ/kg·K)", "id": "s (kJ/kg·K)"},
             ],
             data=data,
-            style_header={
-                "backgroundColor": "rgba(0,212,255,0.08)",
-                "color": "#ccc",
-                "fontWeight": "600",
-                "border": "1px solid rgba(100,120,255,0.1)",
-                "fontFamily": "Inter, sans-serif",
-                "fontSize": "12px",
-            },
-            style_cell={
-                "backgroundColor": "rgba(10,10,30,0.5)",
-                "color": "#bbb",
-                "border": "1px solid rgba(100,120,255,0.06)",
-                "fontFamily": "JetBrains Mono, monospace",
-                "fontSize": "13px",
-                "padding": "10px 14px",
-                "textAlign": "center",
-            },
-            style_data_conditional=[
-                {"if": {"row_index": "odd"},
-                 "backgroundColor": "rgba(20,20,50,0.5)"},
-            ],
+            style_header=_HEADER_STYLE_CYAN,
+            style_cell=_CELL_STYLE_CENTER,
+            style_data_conditional=_ODD_ROW_STYLE,
         ),
     ])
 
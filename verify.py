@@ -1,13 +1,29 @@
 import urllib.request
 
-resp = urllib.request.urlopen("http://127.0.0.1:8050")
-html = resp.read().decode()
+# The page shell is rendered client-side; the component tree lives here.
+URL = "http://127.0.0.1:8050/_dash-layout"
+MARKERS = (b"chart-hs", b"chart-th", b'"Graph"')
+CHUNK = 8192
 
-has_hs = "chart-hs-img" in html
-has_th = "chart-th-img" in html
-has_b64 = "data:image/png;base64" in html
+# Stream the response and stop as soon as every marker has been seen.  The
+# tail of the previous chunk is kept so a marker split across reads still
+# matches.
+found = set()
+tail = b""
+with urllib.request.urlopen(URL) as resp:
+    while len(found) < len(MARKERS):
+        chunk = resp.read(CHUNK)
+        if not chunk:
+            break
+        window = tail + chunk
+        found.update(m for m in MARKERS if m in window)
+        tail = window[-(max(map(len, MARKERS)) - 1):]
 
-print(f"Has chart-hs-img: {has_hs}")
-print(f"Has chart-th-img: {has_th}")
-print(f"Has base64 image: {has_b64}")
-print(f"Result: {'PASS' if has_hs and has_th and has_b64 else 'FAIL'}")
+has_hs = b"chart-hs" in found
+has_th = b"chart-th" in found
+has_graph = b'"Graph"' in found
+
+print(f"Has chart-hs: {has_hs}")
+print(f"Has chart-th: {has_th}")
+print(f"Has Plotly graph: {has_graph}")
+print(f"Result: {'PASS' if has_hs and has_th and has_graph else 'FAIL'}")